@@ -28,7 +28,12 @@ CONSOLE = True  # If build is intended for GUI, set to False
 ADDITIONAL_DATA: list[tuple[str, str]] = [
     # (local file path, destination in build output)
 ]
-HIDDEN_IMPORTS: list[str] = []
+HIDDEN_IMPORTS: list[str] = [
+    # subcommands are imported by name at runtime, PyInstaller can't see them
+    "vinetrimmer.commands.cfg",
+    "vinetrimmer.commands.dl",
+    "vinetrimmer.commands.wvd"
+]
 EXTRA_ARGS = [
     "-y", "--win-private-assemblies", "--win-no-prefer-redirects"
 ]
@@ -41,7 +46,7 @@ Path(f"{NAME}.spec").unlink(missing_ok=True)
 
 """Run PyInstaller with the provided configuration."""
 run([
-    "vinetrimmer/vinetrimmer.py",
+    "vinetrimmer/__main__.py",
     "-n", NAME,
     "-i", ["NONE", ICON_FILE][bool(ICON_FILE)],
     ["-D", "-F"][ONE_FILE],
@@ -0,0 +1,16 @@
+import sys
+
+from vinetrimmer._version import __version__
+
+
+def main() -> None:
+    """Console entry point, answers a bare --version/-V before click, logging, and everything else gets imported."""
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"vinetrimmer {__version__}")
+        return
+    from vinetrimmer.vinetrimmer import main as vt
+    vt()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# Must match [tool.poetry] in pyproject.toml. Kept as constants so startup doesn't need importlib.metadata.
+__version__ = "0.0.7"
+HOMEPAGE = "https://github.com/rlaphoenix/vinetrimmer"
@@ -1,5 +0,0 @@
-from vinetrimmer.commands.cfg import cfg
-from vinetrimmer.commands.dl import dl
-from vinetrimmer.commands.wvd import wvd
-
-__ALL__ = (cfg, dl, wvd)
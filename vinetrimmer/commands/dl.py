@@ -364,7 +364,7 @@ def result(ctx: click.Context, service: services.BaseService, quality: Optional[
                             title=title,
                             track=track,
                             session_id=session_id
-                        ) or ctx.obj.cdm.common_privacy_cert
+                        ) or ctx.obj.cdm.common_privacy_cert_bytes
                     )
                     ctx.obj.cdm.parse_license(
                         session_id,
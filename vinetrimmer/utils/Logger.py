@@ -12,6 +12,10 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 LOG_STYLE = "{"
 LOG_FORMATTER = logging.Formatter(LOG_FORMAT, LOG_DATE_FORMAT, LOG_STYLE)
 
+# tldextract uses filelock, set to info level, annoying
+# pinned once on import, before anything is logged, rather than on every startup after the banner
+logging.getLogger("filelock").setLevel(logging.WARNING)
+
 
 class Logger(logging.Logger):
     def __init__(self, name: str = "root", level: int = logging.NOTSET, color: bool = True):
@@ -55,13 +59,28 @@ class Logger(logging.Logger):
         coloredlogs.install(level=self.level, logger=self, fmt=LOG_FORMAT, datefmt=LOG_DATE_FORMAT, style=LOG_STYLE)
 
 
-# Cache already used loggers to make sure their level is preserved
+# Cache already used loggers so their handlers are only ever set up once
 _loggers: dict[str, Logger] = {}
+# Whether the standard library's root logger (used by third-party libraries) has a handler yet
+_configured = False
 
 
 # noinspection PyPep8Naming
 def getLogger(name: Optional[str] = None, level: int = logging.NOTSET) -> Logger:
+    global _configured
     name = name or "root"
-    _log = _loggers.get(name, Logger(name))
+    _log = _loggers.get(name)
+    if _log is None:
+        _log = _loggers[name] = Logger(name)
     _log.setLevel(level)
+    if name == "root" and level:
+        # mirror our root level onto the standard library root so third-party logs follow it
+        root = logging.getLogger()
+        if not _configured:
+            if not root.handlers:
+                handler = logging.StreamHandler()
+                handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+                root.addHandler(handler)
+            _configured = True
+        root.setLevel(level)
     return _log
@@ -3,5 +3,7 @@ import jsonpickle
 
 class MSLObject:
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "<{} {}>".format(self.__class__.__name__, jsonpickle.encode(self, unpicklable=False))
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
-import base64
-from typing import NoReturn
+from typing import Iterable, NoReturn
 
 from vinetrimmer.utils.MSL import EntityAuthenticationSchemes
 from vinetrimmer.utils.MSL.MSLObject import MSLObject
+from vinetrimmer.utils.MSL.schemes import _b64, _scheme_str
+
+_S_UNAUTH, _S_UNAUTH_SUF, _S_PROV, _S_RSA, _S_X509, _S_NPT, _S_WV, _S_TP, _S_MTP = (
+    EntityAuthenticationSchemes.Unauthenticated,
+    EntityAuthenticationSchemes.UnauthenticatedSuffixed,
+    EntityAuthenticationSchemes.Provisioned,
+    EntityAuthenticationSchemes.RSA,
+    EntityAuthenticationSchemes.X509,
+    EntityAuthenticationSchemes.NPTicket,
+    EntityAuthenticationSchemes.Widevine,
+    EntityAuthenticationSchemes.TrustedProxy,
+    EntityAuthenticationSchemes.MasterTokenProtected,
+)
+_PSK_MGK = frozenset((EntityAuthenticationSchemes.PreSharedKeys, EntityAuthenticationSchemes.ModelGroupKeys))
 
 
 # noinspection PyPep8Naming
 class EntityAuthentication(MSLObject):
 
+    __slots__ = ("scheme", "authdata")
+
     def __init__(self, scheme: EntityAuthenticationSchemes, authdata: dict):
         """
         Data used to identify and authenticate the entity associated with a message.
@@ -18,7 +33,7 @@ class EntityAuthentication(MSLObject):
         :param scheme: Entity Authentication Scheme identifier
         :param authdata: Entity Authentication data
         """
-        self.scheme = str(scheme)
+        self.scheme = _scheme_str(scheme)
         self.authdata = authdata
 
     @classmethod
@@ -31,7 +46,7 @@ class EntityAuthentication(MSLObject):
         event of MSL errors requiring entity re-authentication.
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.Unauthenticated,
+            scheme=_S_UNAUTH,
             authdata={"identity": identity}
         )
 
@@ -48,7 +63,7 @@ class EntityAuthentication(MSLObject):
         The entity identity is then constructed by concatenating the root and suffix with a `.` character.
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.UnauthenticatedSuffixed,
+            scheme=_S_UNAUTH_SUF,
             authdata={
                 "root": root,
                 "suffix": suffix
@@ -65,7 +80,7 @@ class EntityAuthentication(MSLObject):
         or in the event of MSL errors requiring entity re-authentication.
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.Provisioned,
+            scheme=_S_PROV,
             authdata={}
         )
 
@@ -114,9 +129,7 @@ class EntityAuthentication(MSLObject):
         The authentication algorithm is HmacSHA256 and is computed over the binary representation of the encryption
         envelope and included as raw bytes within a version 1 MSL signature envelope.
         """
-        if not isinstance(scheme, EntityAuthenticationSchemes):
-            raise ValueError("scheme must be an EntityAuthenticationScheme")
-        if scheme not in [EntityAuthenticationSchemes.PreSharedKeys, EntityAuthenticationSchemes.ModelGroupKeys]:
+        if scheme not in _PSK_MGK:
             raise ValueError("scheme must be either PreSharedKeys or ModelGroupKeys")
         return cls(
             scheme=scheme,
@@ -139,7 +152,7 @@ class EntityAuthentication(MSLObject):
         envelope.
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.RSA,
+            scheme=_S_RSA,
             authdata={
                 "identity": identity,
                 "pubkeyid": pubkeyid
@@ -163,7 +176,7 @@ class EntityAuthentication(MSLObject):
         :param x509certificate: Base64-encoded X.509 certificate (i.e. PEM formatted)
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.X509,
+            scheme=_S_X509,
             authdata={
                 "x509certificate": x509certificate
             }
@@ -188,12 +201,22 @@ class EntityAuthentication(MSLObject):
         envelope.
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.NPTicket,
+            scheme=_S_NPT,
             authdata={
-                "npticket": base64.standard_b64encode(npticket).decode("utf-8")
+                "npticket": _b64(npticket)
             }
         )
 
+    @classmethod
+    def NPTicketBatch(cls, nptickets: Iterable[bytes]) -> list[EntityAuthentication]:
+        """
+        Create NP-Ticket entity authentication data for many NP-Tickets in one pass.
+        See `NPTicket` for more information on the scheme.
+
+        :param nptickets: NP-Tickets to create entity authentication data for
+        """
+        return [cls(_S_NPT, {"npticket": _b64(x)}) for x in nptickets]
+
     @classmethod
     def Widevine(cls, devtype: str, keyrequest: str) -> EntityAuthentication:
         """
@@ -216,7 +239,7 @@ class EntityAuthentication(MSLObject):
         :param keyrequest: Widevine key request
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.Widevine,
+            scheme=_S_WV,
             authdata={
                 "devtype": devtype,
                 "keyrequest": keyrequest
@@ -260,10 +283,10 @@ class EntityAuthentication(MSLObject):
         :param proxyauthdata: proxy entity authentication data
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.TrustedProxy,
+            scheme=_S_TP,
             authdata={
-                "identity": base64.standard_b64encode(identity).decode("utf-8"),
-                "signature": base64.standard_b64encode(signature).decode("utf-8"),
+                "identity": _b64(identity),
+                "signature": _b64(signature),
                 "proxyscheme": proxyscheme,
                 "proxyauthdata": proxyauthdata
             }
@@ -313,11 +336,11 @@ class EntityAuthentication(MSLObject):
         :param signature: verification data of the encrypted entity authentication data
         """
         return cls(
-            scheme=EntityAuthenticationSchemes.Unauthenticated,
+            scheme=_S_MTP,
             authdata={
                 "mastertoken": mastertoken,
-                "authdata": base64.standard_b64encode(authdata).decode("utf-8"),
-                "signature": base64.standard_b64encode(signature).decode("utf-8"),
+                "authdata": _b64(authdata),
+                "signature": _b64(signature),
             }
         )
 
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-import base64
 from typing import Optional, Union
 
 from vinetrimmer.utils.MSL import KeyExchangeSchemes
 from vinetrimmer.utils.MSL.MSLObject import MSLObject
+from vinetrimmer.utils.MSL.schemes import _b64, _scheme_str
 
 
 # noinspection PyPep8Naming
 class KeyExchangeRequest(MSLObject):
 
+    __slots__ = ("scheme", "keydata")
+
     def __init__(self, scheme: KeyExchangeSchemes, keydata: dict):
         """
         Session key exchange data from a requesting entity.
@@ -18,7 +20,7 @@ class KeyExchangeRequest(MSLObject):
         :param scheme: Key Exchange Scheme identifier
         :param keydata: Key Request data
         """
-        self.scheme = str(scheme)
+        self.scheme = _scheme_str(scheme)
         self.keydata = keydata
 
     @classmethod
@@ -56,7 +58,7 @@ class KeyExchangeRequest(MSLObject):
             keydata={
                 "keypairid": keypairid,
                 "mechanism": mechanism,
-                "publickey": base64.standard_b64encode(publickey).decode("utf-8")
+                "publickey": _b64(publickey)
             }
         )
 
@@ -73,6 +75,19 @@ class KeyExchangeRequest(MSLObject):
             keydata={"keyid": keyid}
         )
 
+    @classmethod
+    def _key_ladder(
+        cls, scheme: KeyExchangeSchemes, mechanism: str, wrapdata: Optional[bytes] = None
+    ) -> KeyExchangeRequest:
+        """Key request data shared by the JSON Web Encryption and JSON Web Key key ladder schemes."""
+        keydata = {"mechanism": mechanism}
+        if wrapdata:
+            keydata["wrapdata"] = _b64(wrapdata)
+        return cls(
+            scheme=scheme,
+            keydata=keydata
+        )
+
     @classmethod
     def JSONWebEncryptionKeyLadder(cls, mechanism: str, wrapdata: Optional[bytes] = None) -> KeyExchangeRequest:
         """
@@ -118,13 +133,7 @@ class KeyExchangeRequest(MSLObject):
         :param mechanism: mechanism for wrapping and unwrapping the new wrapping key
         :param wrapdata: wrapped previous Kwrap
         """
-        keydata = {"mechanism": mechanism}
-        if wrapdata:
-            keydata["wrapdata"] = base64.standard_b64encode(wrapdata).decode("utf-8")
-        return cls(
-            scheme=KeyExchangeSchemes.JSONWebEncryptionKeyLadder,
-            keydata=keydata
-        )
+        return cls._key_ladder(KeyExchangeSchemes.JSONWebEncryptionKeyLadder, mechanism, wrapdata)
 
     @classmethod
     def JSONWebKeyKeyLadder(cls, mechanism: str, wrapdata: Optional[bytes] = None) -> KeyExchangeRequest:
@@ -170,13 +179,7 @@ class KeyExchangeRequest(MSLObject):
         :param mechanism: mechanism for wrapping and unwrapping the new wrapping key
         :param wrapdata: wrapped previous Kwrap
         """
-        keydata = {"mechanism": mechanism}
-        if wrapdata:
-            keydata["wrapdata"] = base64.standard_b64encode(wrapdata).decode("utf-8")
-        return cls(
-            scheme=KeyExchangeSchemes.JSONWebKeyKeyLadder,
-            keydata=keydata
-        )
+        return cls._key_ladder(KeyExchangeSchemes.JSONWebKeyKeyLadder, mechanism, wrapdata)
 
     @classmethod
     def DiffieHellman(cls, parametersid: str, publickey: bytes) -> KeyExchangeRequest:
@@ -210,7 +213,7 @@ class KeyExchangeRequest(MSLObject):
             scheme=KeyExchangeSchemes.DiffieHellman,
             keydata={
                 "parametersid": parametersid,
-                "publickey": base64.standard_b64encode(publickey).decode("utf-8")
+                "publickey": _b64(publickey)
             }
         )
 
@@ -281,10 +284,10 @@ class KeyExchangeRequest(MSLObject):
         keydata = {
             "mechanism": mechanism,
             "parametersid": parametersid,
-            "publickey": base64.standard_b64encode(publickey).decode("utf-8")
+            "publickey": _b64(publickey)
         }
         if wrapdata:
-            keydata["wrapdata"] = base64.standard_b64encode(wrapdata).decode("utf-8")
+            keydata["wrapdata"] = _b64(wrapdata)
         return cls(
             scheme=KeyExchangeSchemes.AuthenticatedDiffieHellman,
             keydata=keydata
@@ -307,7 +310,7 @@ class KeyExchangeRequest(MSLObject):
         :param keyrequest: Base64-encoded Widevine CDM license challenge (PSSH: b'\x0A\x7A\x00\x6C\x38\x2B')
         """
         if not isinstance(keyrequest, str):
-            keyrequest = base64.b64encode(keyrequest).decode()
+            keyrequest = _b64(keyrequest)
         return cls(
             scheme=KeyExchangeSchemes.Widevine,
             keydata={"keyrequest": keyrequest}
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-import base64
 from typing import Any, Optional
 
 from vinetrimmer.utils.MSL.MSLObject import MSLObject
-from vinetrimmer.utils.MSL.schemes import UserAuthenticationSchemes
+from vinetrimmer.utils.MSL.schemes import UserAuthenticationSchemes, _b64, _scheme_str
 
 
 # noinspection PyPep8Naming
 class UserAuthentication(MSLObject):
 
+    __slots__ = ("scheme", "authdata")
+
     def __init__(self, scheme: UserAuthenticationSchemes, authdata: dict):
         """
         Data used to identify and authenticate the user associated with a message.
@@ -18,7 +19,7 @@ class UserAuthentication(MSLObject):
         :param scheme: User Authentication Scheme identifier
         :param authdata: User Authentication data
         """
-        self.scheme = str(scheme)
+        self.scheme = _scheme_str(scheme)
         self.authdata = authdata
 
     @classmethod
@@ -61,8 +62,8 @@ class UserAuthentication(MSLObject):
             scheme=UserAuthenticationSchemes.EmailPasswordHash,
             authdata={
                 "email": email,
-                "hash": base64.standard_b64encode(hash_).decode("utf-8"),
-                "nonce": base64.standard_b64encode(nonce).decode("utf-8")
+                "hash": _b64(hash_),
+                "nonce": _b64(nonce)
             }
         )
 
@@ -133,12 +134,12 @@ class UserAuthentication(MSLObject):
         """
         authdata: dict[str, Any] = {
             "pin": pin,
-            "mdxauthdata": base64.standard_b64encode(mdxauthdata).decode("utf-8"),
-            "signature": base64.standard_b64encode(signature).decode("utf-8")
+            "mdxauthdata": _b64(mdxauthdata),
+            "signature": _b64(signature)
         }
-        if mastertoken and cticket:
-            raise ValueError("Only mastertoken or cticket may be set, not both")
         if mastertoken:
+            if cticket:
+                raise ValueError("Only mastertoken or cticket may be set, not both")
             authdata["mastertoken"] = mastertoken
         elif cticket:
             authdata["cticket"] = cticket
@@ -207,13 +208,14 @@ class UserAuthentication(MSLObject):
         """
         authdata = {
             "mechanism": mechanism,
-            "token": base64.standard_b64encode(token).decode("utf-8")
+            "token": _b64(token)
         }
-        if (email or password) and (netflixid or securenetflixid):
-            raise ValueError("Only email & password or netflixid & securenetflixid may be set, not both")
-        if email and password:
-            authdata["email"] = email
-            authdata["password"] = password
+        if email or password:
+            if netflixid or securenetflixid:
+                raise ValueError("Only email & password or netflixid & securenetflixid may be set, not both")
+            if email and password:
+                authdata["email"] = email
+                authdata["password"] = password
         elif netflixid and securenetflixid:
             authdata["netflixid"] = netflixid
             authdata["securenetflixid"] = securenetflixid
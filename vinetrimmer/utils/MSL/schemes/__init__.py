@@ -1,5 +1,14 @@
+import sys
+from binascii import b2a_base64
 from enum import Enum
 
+try:
+    # SIMD-accelerated base64, falls back to the standard library if not installed
+    from pybase64 import b64encode_as_string as _b64
+except ImportError:
+    def _b64(data: bytes) -> str:
+        return b2a_base64(data, newline=False).decode("ascii")
+
 
 class Scheme(Enum):
     def __str__(self) -> str:
@@ -41,3 +50,15 @@ class KeyExchangeSchemes(Scheme):
     DiffieHellman = "DH"
     AuthenticatedDiffieHellman = "AUTHENTICATED_DH"
     Widevine = "WIDEVINE"
+
+
+# interned scheme strings keyed by enum member, shared by the scheme objects
+_SCHEME_STR = {
+    m: sys.intern(m.value)
+    for schemes in (EntityAuthenticationSchemes, UserAuthenticationSchemes, KeyExchangeSchemes)
+    for m in schemes
+}
+
+
+def _scheme_str(scheme: Scheme) -> str:
+    return _SCHEME_STR.get(scheme) or str(scheme)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import base64
+from os import urandom
 from typing import Union
 from uuid import UUID
 
 from construct import Container
-from Cryptodome.Random import get_random_bytes, random
 
 from vinetrimmer.utils.Widevine.device import LocalDevice, RemoteDevice
 from vinetrimmer.utils.Widevine.key import Key
@@ -27,6 +28,7 @@ class Cdm:
                            "+Gf2Ogsrf9s2LFvE7NVV2FvKqcWTw4PIV9Sdqrd+QLeFHd/SSZiAjjWyWOddeOrAyhb3BHMEwg2T7eTo/xxvF+YkP"
                            "j89qPwXCYcOxF+6gjomPwzvofcJOxkJkoMmMzcFBDopvab5tDQsyN9UPLGhGC98X/8z8QSQ+spbJTYLdgFenFoGq4"
                            "7gLwDS6NWYYQSqzE3Udf2W7pzk4ybyG4PHBYV3s4cyzdq8amvtE/sNSdOKReuHpfQ=")
+    common_privacy_cert_bytes = base64.b64decode(common_privacy_cert)
 
     def __init__(self, device: Union[LocalDevice, RemoteDevice]):
         """Create a Widevine Content Decryption Module using a specific devices data."""
@@ -64,25 +66,23 @@ class Cdm:
     def is_session_open(self, session_id: bytes) -> bool:
         return session_id in self.sessions
 
-    def set_service_certificate(self, session_id: bytes, certificate: Union[bytes, str]) -> bool:
-        if not self.is_session_open(session_id):
+    def get_session(self, session_id: bytes) -> Session:
+        session = self.sessions.get(session_id)
+        if session is None:
             raise ValueError(f"There's no session with the id [{session_id!r}]...")
-        return self.device.set_service_certificate(self.sessions[session_id], certificate)
+        return session
+
+    def set_service_certificate(self, session_id: bytes, certificate: Union[bytes, str]) -> bool:
+        return self.device.set_service_certificate(self.get_session(session_id), certificate)
 
     def get_license_challenge(self, session_id: bytes) -> bytes:
-        if not self.is_session_open(session_id):
-            raise ValueError(f"There's no session with the id [{session_id!r}]...")
-        return self.device.get_license_challenge(self.sessions[session_id])
+        return self.device.get_license_challenge(self.get_session(session_id))
 
     def parse_license(self, session_id: bytes, license_res: Union[bytes, str]) -> bool:
-        if not self.is_session_open(session_id):
-            raise ValueError(f"There's no session with the id [{session_id!r}]...")
-        return self.device.parse_license(self.sessions[session_id], license_res)
+        return self.device.parse_license(self.get_session(session_id), license_res)
 
     def get_keys(self, session_id: bytes, content_only: bool = False) -> list[Key]:
-        if not self.is_session_open(session_id):
-            raise ValueError(f"There's no session with the id [{session_id!r}]...")
-        keys = self.sessions[session_id].keys
+        keys = self.get_session(session_id).keys
         if content_only:
             return [x for x in keys if x.type == "CONTENT"]
         return keys
@@ -90,12 +90,9 @@ class Cdm:
     @staticmethod
     def create_session_id(device: Union[LocalDevice, RemoteDevice]) -> bytes:
         if device.type == LocalDevice.Types.ANDROID:
-            session_id = "{hex:16X}{counter}".format(
-                hex=random.getrandbits(64),
-                counter="01"  # counter, this resets regularly so it's fine to use 01
-            )
-            session_id.ljust(32, "0")  # pad to 16 bytes (32 chars)
-            return session_id.encode("ascii")
+            # 16 random hex chars, the counter (this resets regularly so it's fine to use 01),
+            # then padded to 16 bytes (32 chars)
+            return urandom(8).hex().upper().encode("ascii") + b"01" + b"0" * 14
         if device.type == LocalDevice.Types.CHROME:
-            return get_random_bytes(16)
+            return urandom(16)
         raise ValueError(f"Device Type {device.type.name} is not implemented")
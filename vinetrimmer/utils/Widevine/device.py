@@ -1,33 +1,87 @@
 from __future__ import annotations
 
 import base64
+import hmac
 import random
+import re
 import struct
 import time
 import typing
 from abc import ABCMeta, abstractmethod
+from binascii import a2b_base64, b2a_base64
 from enum import Enum
+from os import urandom
 from pathlib import Path
 from typing import Union
 
-import requests
-import validators
-from construct import BitStruct, Bytes, Const, Container
+from construct import BitStruct, Bytes, Const
 from construct import Enum as CEnum
 from construct import Flag, If, Int8ub, Int16ub, Optional, Padded, Padding, Struct, this
 from Cryptodome.Cipher import AES, PKCS1_OAEP
-from Cryptodome.Hash import CMAC, HMAC, SHA1, SHA256
 from Cryptodome.PublicKey import RSA
-from Cryptodome.Random import get_random_bytes
-from Cryptodome.Signature import pss
 from Cryptodome.Util import Padding as CPadding
 from google.protobuf.message import DecodeError
-from pymp4.parser import Box
 
 from vinetrimmer.utils.Widevine.key import Key
 from vinetrimmer.utils.Widevine.protos import widevine_pb2 as widevine
 from vinetrimmer.utils.Widevine.session import Session
 
+if typing.TYPE_CHECKING:
+    import requests
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+_URL_RE = re.compile(r"^[a-z][a-z0-9+.\-]*://", re.IGNORECASE)
+
+# license key derivation context: label, then the license request, then the key size in bits
+_ENC_KEY_LABEL = b"ENCRYPTION\0"
+_ENC_KEY_SIZE = (128).to_bytes(4, "big")
+_AUTH_KEY_LABEL = b"AUTHENTICATION\0"
+_AUTH_KEY_SIZE = (512).to_bytes(4, "big")
+
+
+def _cmac_subkeys(key: bytes) -> tuple[int, int]:
+    """Derive the AES-CMAC subkeys K1 and K2 (RFC 4493) with a single block encryption."""
+    k1 = int.from_bytes(AES.new(key, AES.MODE_ECB).encrypt(bytes(16)), "big") << 1
+    if k1 >> 128:
+        k1 = (k1 & ((1 << 128) - 1)) ^ 0x87
+    k2 = k1 << 1
+    if k2 >> 128:
+        k2 = (k2 & ((1 << 128) - 1)) ^ 0x87
+    return k1, k2
+
+
+def _aes_cmac(key: bytes, subkeys: tuple[int, int], data: bytes) -> bytes:
+    """AES-CMAC (RFC 4493) of data using subkeys precomputed with `_cmac_subkeys`."""
+    remainder = len(data) % 16
+    if data and not remainder:
+        head, last, subkey = data[:-16], data[-16:], subkeys[0]
+    else:
+        head, last, subkey = data[:len(data) - remainder], data[len(data) - remainder:], subkeys[1]
+        last += b"\x80" + bytes(15 - remainder)
+    last = (int.from_bytes(last, "big") ^ subkey).to_bytes(16, "big")
+    return AES.new(key, AES.MODE_CBC, iv=bytes(16)).encrypt(head + last)[-16:]
+
+
+def _aes_cbc_decrypt_unpad(ecb: typing.Any, iv: bytes, data: bytes) -> bytes:
+    """AES-CBC decrypt data using a reusable AES-ECB cipher object and strip its PKCS#7 padding."""
+    if not data:
+        raise ValueError("Input data is not padded")
+    plaintext = (
+        int.from_bytes(ecb.decrypt(data), "big") ^ int.from_bytes(iv + data[:-16], "big")
+    ).to_bytes(len(data), "big")
+    pad = plaintext[-1]
+    if not 1 <= pad <= 16 or plaintext[-pad:] != bytes((pad,)) * pad:
+        raise ValueError("Padding is incorrect.")
+    return plaintext[:-pad]
+
+
+def _b64e(data: bytes) -> str:
+    return b2a_base64(data, newline=False).decode("ascii")
+
+
+def _b64d(data: Union[bytes, str]) -> bytes:
+    return a2b_base64(data)
+
 
 class BaseDevice(metaclass=ABCMeta):
     class Types(Enum):
@@ -109,6 +163,14 @@ class LocalDevice(BaseDevice):
         self.security_level = security_level
         self.flags = flags
         self.private_key = RSA.importKey(private_key)
+        self._private_key_cipher = PKCS1_OAEP.new(self.private_key)
+        # OpenSSL-backed copy of the private key for one-shot RSASSA-PSS signing
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+        private_key_signer = serialization.load_der_private_key(self.private_key.export_key("DER"), None)
+        if not isinstance(private_key_signer, rsa.RSAPrivateKey):
+            raise ValueError("private_key is not an RSA private key")
+        self._private_key_signer: rsa.RSAPrivateKey = private_key_signer
         self.client_id = widevine.ClientIdentification()
         try:
             self.client_id.ParseFromString(client_id)
@@ -122,6 +184,7 @@ class LocalDevice(BaseDevice):
                 raise ValueError("Verified Media Path (VMP) could not be parsed as FileHashes")
             # noinspection PyProtectedMember
             self.client_id._FileHashes.CopyFrom(self.vmp)
+        self._client_id_bytes = self.client_id.SerializeToString()
 
         self.sessions: dict[bytes, Session] = {}
 
@@ -131,22 +194,66 @@ class LocalDevice(BaseDevice):
             # noinspection PyProtectedMember
             self.system_id = self.client_id.Token._DeviceCertificate.SystemId
 
+    @classmethod
+    def _parse_bytes(cls, data: bytes) -> dict[str, typing.Any]:
+        """
+        Parse WVD data into the same fields `WidevineDeviceStruct.parse` would produce.
+        The WVD layout is simple enough that plain struct unpacking is a lot faster than construct.
+        """
+        if data[:3] != b"WVD":
+            raise ValueError("Invalid WVD signature")
+        try:
+            version, type_, security_level, flags, private_key_len = struct.unpack_from(">BBBBH", data, 3)
+            offset = 9 + private_key_len
+            private_key = data[9:offset]
+            client_id_len, = struct.unpack_from(">H", data, offset)
+            offset += 2
+            client_id = data[offset:offset + client_id_len]
+            offset += client_id_len
+        except struct.error:
+            raise ValueError("WVD data is truncated")
+        if len(private_key) != private_key_len or len(client_id) != client_id_len:
+            raise ValueError("WVD data is truncated")
+        vmp_len = None
+        vmp = None
+        if len(data) >= offset + 2:
+            vmp_len, = struct.unpack_from(">H", data, offset)
+            if vmp_len:
+                vmp = data[offset + 2:offset + 2 + vmp_len]
+                if len(vmp) != vmp_len:
+                    vmp = None
+        return dict(
+            signature=b"WVD",
+            version=version,
+            type=cls.Types(type_),
+            security_level=security_level,
+            flags={"send_key_control_nonce": bool(flags & 1)},
+            private_key_len=private_key_len,
+            private_key=private_key,
+            client_id_len=client_id_len,
+            client_id=client_id,
+            vmp_len=vmp_len,
+            vmp=vmp
+        )
+
     @classmethod
     def load(cls, uri: Union[Path, str, bytes], session: Optional[requests.Session] = None) -> LocalDevice:
         if isinstance(uri, bytes):
             # direct data
-            return cls(**cls.WidevineDeviceStruct.parse(uri))
+            return cls(**cls._parse_bytes(uri))
         if isinstance(uri, Path):
             # local file
-            with uri.open(mode="rb") as f:
-                return cls(**cls.WidevineDeviceStruct.parse_stream(f))
-        if validators.url(uri):
+            return cls(**cls._parse_bytes(uri.read_bytes()))
+        if isinstance(uri, str) and _URL_RE.match(uri):
             # remote url
-            return cls(**cls.WidevineDeviceStruct.parse((session or requests.Session()).get(uri).content))
+            import requests
+            return cls(**cls._parse_bytes((session or requests.Session()).get(uri).content))
         raise ValueError("Unsupported URI. Ensure URI is a valid URL or a pathlib.Path object if local file.")
 
     def dumpb(self) -> bytes:
         private_key = self.private_key.export_key("DER") if self.private_key else None
+        client_id = self._client_id_bytes if self.client_id else None
+        vmp = self.vmp.SerializeToString() if self.vmp else None
         return self.WidevineDeviceStruct.build(dict(
             version=self.WidevineDeviceStructVersion,
             type=self.type.value,
@@ -154,10 +261,10 @@ class LocalDevice(BaseDevice):
             flags=self.flags,
             private_key_len=len(private_key) if private_key else 0,
             private_key=private_key,
-            client_id_len=len(self.client_id.SerializeToString()) if self.client_id else 0,
-            client_id=self.client_id.SerializeToString() if self.client_id else None,
-            vmp_len=len(self.vmp.SerializeToString()) if self.vmp else 0,
-            vmp=self.vmp.SerializeToString() if self.vmp else None
+            client_id_len=len(client_id) if client_id else 0,
+            client_id=client_id,
+            vmp_len=len(vmp) if vmp else 0,
+            vmp=vmp
         ))
 
     def dump(self, path: Path) -> None:
@@ -179,7 +286,12 @@ class LocalDevice(BaseDevice):
         except DecodeError:
             raise ValueError("Certificate's message could not be parsed as a SignedDeviceCertificate")
 
+        # noinspection PyProtectedMember
+        device_certificate = signed_device_certificate._DeviceCertificate
         session.signed_device_certificate = signed_device_certificate
+        session.service_id = device_certificate.ServiceId.decode()
+        session.service_certificate_serial = device_certificate.SerialNumber
+        session.service_cipher = PKCS1_OAEP.new(RSA.importKey(device_certificate.PublicKey))
         session.privacy_mode = True
 
         return True
@@ -213,39 +325,43 @@ class LocalDevice(BaseDevice):
             license_request.Msg.KeyControlNonce = random.randrange(1, 2 ** 31)
 
         if session.privacy_mode:
-            cid_aes_key = get_random_bytes(16)
-            cid_iv = get_random_bytes(16)
+            cid_aes_key = urandom(16)
+            cid_iv = urandom(16)
 
             enc_client_id = widevine.EncryptedClientIdentification()
             if not session.signed_device_certificate:
                 raise ValueError("Missing signed_device_certificate")
-            enc_client_id.ServiceId = session.signed_device_certificate._DeviceCertificate.ServiceId.decode()
-            enc_client_id.ServiceCertificateSerialNumber = (
-                session.signed_device_certificate._DeviceCertificate.SerialNumber
-            )
+            if session.service_id is None or session.service_certificate_serial is None or not session.service_cipher:
+                raise ValueError("Missing service certificate fields, set the service certificate first")
+            enc_client_id.ServiceId = session.service_id
+            enc_client_id.ServiceCertificateSerialNumber = session.service_certificate_serial
             enc_client_id.EncryptedClientId = AES.new(cid_aes_key, AES.MODE_CBC, cid_iv).encrypt(
-                CPadding.pad(self.client_id.SerializeToString(), 16)
+                CPadding.pad(self._client_id_bytes, 16)
             )
 
             enc_client_id.EncryptedClientIdIv = cid_iv
-            enc_client_id.EncryptedPrivacyKey = PKCS1_OAEP.new(
-                RSA.importKey(session.signed_device_certificate._DeviceCertificate.PublicKey)
-            ).encrypt(cid_aes_key)
+            enc_client_id.EncryptedPrivacyKey = session.service_cipher.encrypt(cid_aes_key)
 
             license_request.Msg.EncryptedClientId.CopyFrom(enc_client_id)
         else:
             license_request.Msg.ClientId.CopyFrom(self.client_id)
 
-        license_request.Signature = pss.new(self.private_key).sign(
-            SHA1.new(license_request.Msg.SerializeToString())
+        license_request_msg = license_request.Msg.SerializeToString()
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding as asym_padding
+        license_request.Signature = self._private_key_signer.sign(
+            license_request_msg,
+            asym_padding.PSS(mgf=asym_padding.MGF1(hashes.SHA1()), salt_length=hashes.SHA1.digest_size),
+            hashes.SHA1()
         )
 
         session.license_request = license_request
+        session.license_request_msg = license_request_msg
 
         return session.license_request.SerializeToString()
 
     def parse_license(self, session: Session, license_res: Union[bytes, str]) -> bool:
-        if not session.license_request:
+        if not session.license_request_msg:
             raise ValueError("No license request for the session was created. Create one first.")
 
         if isinstance(license_res, str):
@@ -259,17 +375,17 @@ class LocalDevice(BaseDevice):
         session.signed_license = signed_license
 
         def get_auth_keys(*i: int, k: bytes, b: bytes) -> bytes:
-            if len(i) > 1:
-                return b"".join([get_auth_keys(x, k=k, b=b) for x in i])
-            c = CMAC.new(k, ciphermod=AES)
-            c.update(struct.pack("B", i[0]) + b)
-            return c.digest()
+            keys = bytearray()
+            for counter in i:
+                keys += _aes_cmac(k, cmac_subkeys, bytes((counter,)) + b)
+            return bytes(keys)
 
-        license_req_msg = session.license_request.Msg.SerializeToString()
-        enc_key_base = b"ENCRYPTION\000%b\0\0\0\x80" % license_req_msg
-        auth_key_base = b"AUTHENTICATION\0%b\0\0\2\0" % license_req_msg
+        license_req_msg = session.license_request_msg
+        enc_key_base = b"".join((_ENC_KEY_LABEL, license_req_msg, _ENC_KEY_SIZE))
+        auth_key_base = b"".join((_AUTH_KEY_LABEL, license_req_msg, _AUTH_KEY_SIZE))
 
-        session.session_key = PKCS1_OAEP.new(self.private_key).decrypt(session.signed_license.SessionKey)
+        session.session_key = self._private_key_cipher.decrypt(session.signed_license.SessionKey)
+        cmac_subkeys = _cmac_subkeys(session.session_key)
         session.derived_keys["enc"] = get_auth_keys(1, k=session.session_key, b=enc_key_base)
         session.derived_keys["auth_1"] = get_auth_keys(1, 2, k=session.session_key, b=auth_key_base)
         session.derived_keys["auth_2"] = get_auth_keys(3, 4, k=session.session_key, b=auth_key_base)
@@ -277,11 +393,11 @@ class LocalDevice(BaseDevice):
         assert session.derived_keys["enc"] is not None
         assert session.derived_keys["auth_1"] is not None
 
-        lic_hmac = HMAC.new(session.derived_keys["auth_1"], digestmod=SHA256)
-        lic_hmac.update(session.signed_license.Msg.SerializeToString())
-        if lic_hmac.digest() != session.signed_license.Signature:
+        lic_hmac = hmac.digest(session.derived_keys["auth_1"], session.signed_license.Msg.SerializeToString(), "sha256")
+        if not hmac.compare_digest(lic_hmac, session.signed_license.Signature):
             raise ValueError("SignedLicense Signature doesn't match its Message")
 
+        enc_cipher = AES.new(session.derived_keys["enc"], AES.MODE_ECB)
         for key in session.signed_license.Msg.Key:
             key_type = widevine.License.KeyContainer.KeyType.Name(key.Type)
             permissions = []
@@ -292,7 +408,7 @@ class LocalDevice(BaseDevice):
             session.keys.append(Key(
                 kid=key.Id if key.Id else key_type.encode("utf8"),
                 key_type=key_type,
-                key=CPadding.unpad(AES.new(session.derived_keys["enc"], AES.MODE_CBC, iv=key.Iv).decrypt(key.Key), 16),
+                key=_aes_cbc_decrypt_unpad(enc_cipher, key.Iv, key.Key),
                 permissions=permissions
             ))
 
@@ -316,7 +432,7 @@ class RemoteDevice(BaseDevice):
 
     def set_service_certificate(self, session: Session, certificate: Union[bytes, str]) -> bool:
         if isinstance(certificate, bytes):
-            certificate = base64.b64encode(certificate).decode()
+            certificate = _b64e(certificate)
 
         # certificate needs to be base64 to be sent off to the API.
         # it needs to intentionally be kept as base64 encoded SignedMessage.
@@ -327,14 +443,8 @@ class RemoteDevice(BaseDevice):
         return True
 
     def get_license_challenge(self, session: Session) -> bytes:
-        pssh = session.pssh
-        if isinstance(pssh, Container):
-            pssh = Box.build(pssh)
-        if isinstance(pssh, bytes):
-            pssh = base64.b64encode(pssh).decode()
-
         res = self.session("GetChallenge", {
-            "init": pssh,
+            "init": session.pssh_b64,
             "cert": session.signed_device_certificate,
             "raw": session.raw,
             "licensetype": "OFFLINE" if session.offline else "STREAMING",
@@ -343,21 +453,22 @@ class RemoteDevice(BaseDevice):
 
         self.api_session_id = res["session_id"]
 
-        return base64.b64decode(res["challenge"])
+        return _b64d(res["challenge"])
 
     def parse_license(self, session: Session, license_res: Union[bytes, str]) -> bool:
         if isinstance(license_res, bytes):
-            license_res = base64.b64encode(license_res).decode()
+            license_res = _b64e(license_res)
 
         res = self.session("GetKeys", {
             "cdmkeyresponse": license_res,
             "session_id": self.api_session_id
         })
 
+        fromhex = bytes.fromhex
         session.keys.extend([Key(
-            kid=bytes.fromhex(x["kid"]),
+            kid=fromhex(x["kid"]),
             key_type="CONTENT",  # assuming
-            key=bytes.fromhex(x["key"])
+            key=fromhex(x["key"])
         ) for x in res["keys"]])
 
         return True
@@ -365,20 +476,21 @@ class RemoteDevice(BaseDevice):
     def exchange(self, session: Session, license_res: Union[bytes, str], enc_key_id: Union[bytes, str],
                  hmac_key_id: Union[bytes, str]) -> tuple[bytes, bytes]:
         if isinstance(license_res, bytes):
-            license_res = base64.b64encode(license_res).decode()
+            license_res = _b64e(license_res)
         if isinstance(enc_key_id, bytes):
-            enc_key_id = base64.b64encode(enc_key_id).decode()
+            enc_key_id = _b64e(enc_key_id)
         if isinstance(hmac_key_id, bytes):
-            hmac_key_id = base64.b64encode(hmac_key_id).decode()
+            hmac_key_id = _b64e(hmac_key_id)
         res = self.session("GetKeysX", {
             "cdmkeyresponse": license_res,
             "encryptionkeyid": enc_key_id,
             "hmackeyid": hmac_key_id,
             "session_id": self.api_session_id
         })
-        return base64.b64decode(res["encryption_key"]), base64.b64decode(res["sign_key"])
+        return _b64d(res["encryption_key"]), _b64d(res["sign_key"])
 
     def session(self, method: str, params: Optional[dict] = None) -> dict:
+        import requests
         try:
             r = requests.post(
                 self.host,
@@ -3,34 +3,61 @@ from __future__ import annotations
 import struct
 from pathlib import Path
 
-from crccheck.crc import Crc32Mpeg2
+try:
+    # native CRC-32/MPEG-2, uses carry-less multiplication folding where available
+    from fastcrc.crc32 import mpeg_2 as _crc32_mpeg2
+except ImportError:
+    def _crc32_mpeg2_table() -> tuple[int, ...]:
+        table = []
+        for i in range(256):
+            crc = i << 24
+            for _ in range(8):
+                crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+            table.append(crc & 0xFFFFFFFF)
+        return tuple(table)
+
+    _CRC32_MPEG2_TABLE = _crc32_mpeg2_table()
+
+    def _crc32_mpeg2(data: bytes) -> int:
+        """CRC-32/MPEG-2 (poly 0x04C11DB7, init 0xFFFFFFFF, no reflection, no xorout)."""
+        table = _CRC32_MPEG2_TABLE
+        crc = 0xFFFFFFFF
+        for b in data:
+            crc = ((crc << 8) & 0xFFFFFFFF) ^ table[(crc >> 24) ^ b]
+        return crc
+
+
+_U32BE = struct.Struct(">L")
+_U32BE_2 = struct.Struct(">LL")
 
 
 class Keybox:
     def __init__(self, data: bytes):
-        length = len(data)
+        # work on a view so validation slices don't copy, only stored fields are materialized
+        view = memoryview(data)
+        length = len(view)
         if length not in (128, 132):
             raise ValueError(f"Invalid keybox length: {length}. Should be 128 or 132 bytes")
 
-        if length == 128:  # QSEE style keybox
-            if data[0x80:0x84] != b"LVL1":
+        if length == 132:  # QSEE style keybox
+            if view[0x80:0x84] != b"LVL1":
                 raise ValueError("QSEE style keybox does not end in bytes 'LVL1'")
-            data = data[0:0x80]
+            view = view[0:0x80]
 
-        if data[0x78:0x7C] != b"kbox":
+        if view[0x78:0x7C] != b"kbox":
             raise ValueError("Invalid keybox magic")
 
-        body_crc = Crc32Mpeg2.calc(data[:0x7C])
-        body_crc_expected = struct.unpack(">L", data[0x7C:0x7C + 4])[0]
+        body_crc = _crc32_mpeg2(bytes(view[:0x7C]))
+        body_crc_expected, = _U32BE.unpack_from(view, 0x7C)
         if body_crc_expected != body_crc:
             raise ValueError(f"Keybox CRC is bad. Expected: 0x{body_crc_expected:08X}. Computed: 0x{body_crc:08X}")
 
-        self.stable_id = data[0x00:0x20]  # aka device ID
-        self.device_aes_key = data[0x20:0x30]
-        self.device_id = data[0x30:0x78]  # device id sent to google, possibly flags + system_id + encrypted
+        self.stable_id = view[0x00:0x20].tobytes()  # aka device ID
+        self.device_aes_key = view[0x20:0x30].tobytes()
+        self.device_id = view[0x30:0x78].tobytes()  # device id sent to google, possibly flags + system_id + encrypted
 
         # known fields
-        self.flags, self.system_id = struct.unpack(">L", self.device_id[0:8])[:2]
+        self.flags, self.system_id = _U32BE_2.unpack_from(self.device_id)
 
     def __str__(self) -> str:
         return f"{self.stable_id.decode('utf8').strip()} ({self.system_id})"
@@ -1,8 +1,7 @@
 import base64
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from construct import Container
-from pymp4.parser import Box
 
 from vinetrimmer.utils.Widevine.key import Key
 from vinetrimmer.utils.Widevine.protos import widevine_pb2 as widevine
@@ -26,10 +25,15 @@ class Session:
             "auth_2": None
         }
         self.license_request: Union[widevine.SignedLicenseRequest, widevine.SignedLicenseRequestRaw]
+        self.license_request_msg: Optional[bytes] = None  # serialized license_request.Msg, as signed
         self.signed_license: Optional[widevine.SignedLicense] = None
         self.signed_device_certificate: Optional[widevine.SignedDeviceCertificate] = None
+        self.service_id: Optional[str] = None
+        self.service_certificate_serial: Optional[bytes] = None
+        self.service_cipher: Optional[Any] = None  # PKCS1_OAEP cipher of the service certificate's public key
         self.privacy_mode = False
         self.keys: list[Key] = []
+        self._pssh_b64: Optional[str] = None
 
     def __repr__(self) -> str:
         return "{name}({items})".format(
@@ -37,6 +41,19 @@ class Session:
             items=", ".join([f"{k}={repr(v)}" for k, v in self.__dict__.items()])
         )
 
+    @property
+    def pssh_b64(self) -> str:
+        """The PSSH data as base64, building and encoding a PSSH Box Container only once."""
+        if self._pssh_b64 is None:
+            pssh = self.pssh
+            if isinstance(pssh, Container):
+                from pymp4.parser import Box
+                pssh = Box.build(pssh)
+            if isinstance(pssh, bytes):
+                pssh = base64.b64encode(pssh).decode()
+            self._pssh_b64 = pssh
+        return self._pssh_b64
+
     @staticmethod
     def parse_pssh_box(pssh: Union[str, bytes, Container]) -> widevine.WidevineCencHeader:
         """
@@ -51,6 +68,7 @@ class Session:
         if isinstance(pssh, str):
             pssh = base64.b64decode(pssh)
         if not isinstance(pssh, Container):
+            from pymp4.parser import Box
             pssh = Box.parse(pssh)
         cenc_header = widevine.WidevineCencHeader()
         cenc_header.ParseFromString(pssh.init_data)
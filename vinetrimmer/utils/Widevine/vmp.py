@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
+from typing import Iterator
 
 try:
     # this was tested to work with protobuf 3, but it's an internal API (any varint decoder might work)
@@ -10,8 +11,17 @@ except ImportError:
     # this is generic and does not depend on pb internals,
     # however it will decode "larger" possible numbers than pb decoder which has them fixed
     def leb128_decode(buffer: bytes, pos: int, limit: int = 64) -> tuple[int, int]:
-        result = 0
-        shift = 0
+        # one and two byte values are nearly all of them, return those before entering the loop
+        b = buffer[pos]
+        if b < 0x80:
+            return b, pos + 1
+        result = b & 0x7F
+        b = buffer[pos + 1]
+        if b < 0x80:
+            return result | (b << 7), pos + 2
+        result |= (b & 0x7F) << 7
+        pos += 2
+        shift = 14
         while True:
             b = buffer[pos]
             pos += 1
@@ -43,23 +53,30 @@ class VariableReader(FromFileMixin):
 
     def __init__(self, buf: bytes):
         self.buf = buf
+        self.mv = memoryview(buf)  # payloads are handed out as zero-copy views of this
         self.pos = 0
         self.size = len(buf)
 
     def read_int(self) -> int:
         """Read a variable length integer"""
+        pos = self.pos
+        b = self.buf[pos]
+        if b < 0x80:
+            # single byte varints are by far the most common (tags, short lengths), skip the decoder call
+            self.pos = pos + 1
+            return b
         # _DecodeVarint will take care of out of range errors
-        val, nextpos = _di(self.buf, self.pos)
+        val, nextpos = _di(self.buf, pos)
         self.pos = nextpos
         return val
 
-    def read_bytes_raw(self, size: int) -> bytes:
+    def read_bytes_raw(self, size: int) -> memoryview:
         """Read size bytes"""
-        b = self.buf[self.pos:self.pos + size]
+        b = self.mv[self.pos:self.pos + size]
         self.pos += size
         return b
 
-    def read_bytes(self) -> bytes:
+    def read_bytes(self) -> memoryview:
         """Read a bytes object"""
         size = self.read_int()
         return self.read_bytes_raw(size)
@@ -71,19 +88,33 @@ class VariableReader(FromFileMixin):
 class TaggedReader(VariableReader):
     """Tagged reader, needed for implementing a Widevine signature reader"""
 
-    def read_tag(self) -> tuple[int, bytes]:
+    def read_tag(self) -> tuple[int, memoryview]:
         """Read a tagged buffer"""
         return self.read_int(), self.read_bytes()
 
-    def read_all_tags(self, max_tag: int = 3) -> dict[int, bytes]:
-        tags = {}
-        while not self.is_end():
-            tag, bytes_ = self.read_tag()
+    def iter_tags(self, max_tag: int = 3) -> Iterator[tuple[int, memoryview]]:
+        # decode every tag, length, and payload in this one loop with locals, only multi-byte varints leave it
+        buf, mv, pos, size = self.buf, self.mv, self.pos, self.size
+        while pos != size:
+            tag = buf[pos]
+            if tag < 0x80:
+                pos += 1
+            else:
+                tag, pos = _di(buf, pos)
             if tag > max_tag:
                 raise IndexError("tag out of bound: got {}, max {}".format(tag, max_tag))
 
-            tags[tag] = bytes_
-        return tags
+            length = buf[pos]
+            if length < 0x80:
+                pos += 1
+            else:
+                length, pos = _di(buf, pos)
+            self.pos = pos + length
+            yield tag, mv[pos:pos + length]
+            pos += length
+
+    def read_all_tags(self, max_tag: int = 3) -> dict[int, memoryview]:
+        return dict(self.iter_tags(max_tag))
 
 
 class WidevineSignatureReader(FromFileMixin):
@@ -95,21 +126,44 @@ class WidevineSignatureReader(FromFileMixin):
 
     def __init__(self, buf: bytes):
         reader = TaggedReader(buf)
-        self.version = reader.read_int()
-        if self.version != 0:
-            raise Exception("Unsupported signature format version {}".format(self.version))
-        self.tags = reader.read_all_tags()
-
-        self.signer = self.tags[self.SIGNER_TAG]
-        self.signature = self.tags[self.SIGNATURE_TAG]
+        self.version = self._read_version(reader)
+        self.signer, self.signature, extra = self._parse_known(reader)
 
-        extra = self.tags[self.ISMAINEXE_TAG]
         if len(extra) != 1 or (extra[0] > 1):
             raise Exception(f"Unexpected 'ismainexe' field value (not '\\x00' or '\\x01'), please check: {extra!r}")
 
         self.mainexe = bool(extra[0])
 
+    @staticmethod
+    def _read_version(reader: TaggedReader) -> int:
+        version = reader.read_int()
+        if version != 0:
+            raise Exception("Unsupported signature format version {}".format(version))
+        return version
+
+    @classmethod
+    def _parse_known(cls, reader: TaggedReader) -> tuple[bytes, bytes, bytes]:
+        """Read the signer, signature, and ismainexe tags straight into locals, without a tags dict."""
+        signer = signature = extra = None
+        for tag, bytes_ in reader.iter_tags(cls.ISMAINEXE_TAG):
+            if tag == cls.SIGNER_TAG:
+                signer = bytes_
+            elif tag == cls.SIGNATURE_TAG:
+                signature = bytes_
+            elif tag == cls.ISMAINEXE_TAG:
+                extra = bytes_
+        if signer is None:
+            raise KeyError(cls.SIGNER_TAG)
+        if signature is None:
+            raise KeyError(cls.SIGNATURE_TAG)
+        if extra is None:
+            raise KeyError(cls.ISMAINEXE_TAG)
+        # only what's kept gets copied out of the file buffer
+        return bytes(signer), bytes(signature), bytes(extra)
+
     @classmethod
     def get_tags(cls, filename: Path) -> dict[int, bytes]:
         """Return a dictionary of each tag in the signature file"""
-        return cls.from_file(filename).tags
+        reader = TaggedReader(filename.read_bytes())
+        cls._read_version(reader)
+        return {tag: bytes(bytes_) for tag, bytes_ in reader.read_all_tags(cls.ISMAINEXE_TAG).items()}
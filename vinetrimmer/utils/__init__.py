@@ -1,5 +1,7 @@
 import ast
-from typing import Optional, Sequence, Union
+import struct
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
 
 from langcodes import Language, closest_match
 from pymp4.parser import Box
@@ -8,6 +10,9 @@ from vinetrimmer.constants import LANGUAGE_MAX_DISTANCE
 from vinetrimmer.utils.Widevine.cdm import Cdm  # noqa: F401
 from vinetrimmer.utils.Widevine.protos.widevine_pb2 import WidevineCencHeader  # noqa: F401
 
+_U32BE = struct.Struct(">I")
+_U64BE = struct.Struct(">Q")
+
 
 class FPS(ast.NodeVisitor):
     def visit_BinOp(self, node: ast.BinOp) -> float:
@@ -24,45 +29,81 @@ class FPS(ast.NodeVisitor):
 
     @classmethod
     def parse(cls, expr: str) -> float:
-        return cls().visit(ast.parse(expr).body[0])
+        # fast path for the usual "num/den" or plain number, the AST walk handles anything else
+        try:
+            if "/" in expr:
+                numerator, denominator = expr.split("/", 1)
+                return int(numerator) / int(denominator)
+            try:
+                return int(expr)
+            except ValueError:
+                return float(expr)
+        except ValueError:
+            return cls().visit(ast.parse(expr).body[0])
 
 
 def get_boxes(data: bytes, box_type: bytes, as_bytes: bool = False) -> Box:
-    """Scan a byte array for a wanted box, then parse and yield each find."""
+    """
+    Scan a byte array for a wanted box, then parse and yield each find.
+
+    With as_bytes, a box whose header gives a usable size is sliced out as-is without being parsed,
+    only its header is checked, so the payload is not validated.
+    """
     # using slicing to get to the wanted box is done because parsing the entire box and recursively
     # scanning through each box and its children often wouldn't scan far enough to reach the wanted box.
     # since it doesnt care what child box the wanted box is from, this works fine.
     if not isinstance(data, (bytes, bytearray)):
         raise ValueError("data must be bytes")
+    # walk a cursor through the data instead of re-slicing it, so each search runs on the tail without copying
+    view = memoryview(data)
+    end = len(data)
+    pos = 0
     while True:
         try:
-            index = data.index(box_type)
+            index = data.index(box_type, pos)
         except ValueError:
             break
-        if index < 0:
-            break
-        if index > 4:
-            index -= 4  # size is before box type and is 4 bytes long
-        data = data[index:]
-        try:
-            box = Box.parse(data)
-        except IOError:
-            # TODO: Does this miss any data we may need?
-            break
-        if as_bytes:
-            box = Box.build(box)
-        yield box
+        start = index - 4 if index >= 4 else index  # size is before box type and is 4 bytes long
+        size = 0
+        header_size = 8
+        if start < index:
+            size = _U32BE.unpack_from(data, start)[0]
+            if size == 1 and start + 16 <= end:
+                size = _U64BE.unpack_from(data, start + 8)[0]  # 64-bit largesize follows the type
+                header_size = 16
+            elif size == 0:
+                size = end - start  # box extends to the end of the data
+        if as_bytes and header_size <= size <= end - start and data[start + 4:start + 8] == box_type:
+            # the raw box is already right here, no need to parse and rebuild it
+            yield bytes(view[start:start + size])
+        else:
+            try:
+                # bound the parse to the box, construct copies whatever it's given into a BytesIO
+                box = Box.parse(view[start:start + size] if 8 <= size <= end - start else view[start:])
+            except IOError:
+                # TODO: Does this miss any data we may need?
+                break
+            if as_bytes:
+                box = Box.build(box)
+            yield box
+        # continue after the box, or just past its type if it has no usable size
+        pos = start + size if size >= 8 else index + len(box_type)
+
+
+@lru_cache(maxsize=1024)
+def _closest_match(language: str, languages: Tuple[str, ...]) -> Tuple[str, int]:
+    # track selection asks about the same few language pairs over and over
+    return closest_match(language, list(languages))
 
 
 def is_close_match(language: Union[str, Language], languages: Optional[Sequence[Union[str, Language, None]]]) -> bool:
     if not languages:
         return False
-    languages = list(map(str, [x for x in languages if x]))
-    return closest_match(language, languages)[1] <= LANGUAGE_MAX_DISTANCE
+    return _closest_match(str(language), tuple(str(x) for x in languages if x))[1] <= LANGUAGE_MAX_DISTANCE
 
 
 def get_closest_match(language: Union[str, Language], languages: Sequence[Union[str, Language]]) -> Optional[Language]:
-    match, distance = closest_match(language, list(map(str, languages)))
+    match, distance = _closest_match(str(language), tuple(map(str, languages)))
     if distance > LANGUAGE_MAX_DISTANCE:
         return None
     return Language.get(match)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import re
 from http.cookiejar import MozillaCookieJar
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 import click
 
@@ -11,6 +11,13 @@ from vinetrimmer.objects.vaults import Vaults
 from vinetrimmer.services import SERVICE_MAP
 from vinetrimmer.utils import Cdm
 
+_SE_RE = re.compile(r"^S(?P<season>\d+)(E(?P<episode>\d+))?$", re.IGNORECASE)
+_SPLIT_RE = re.compile(r"[:-]")
+_CSV_RE = re.compile(r"\s*[,;]\s*")
+
+# lowercase alias -> service key, built in reverse so the first service listing an alias keeps it
+_ALIAS_INDEX = {alias.lower(): key for key, aliases in reversed(list(SERVICE_MAP.items())) for alias in aliases}
+
 
 class ContextData:
     def __init__(self, config: dict, vaults: Vaults, cdm: Cdm, profile: Optional[str] = None,
@@ -30,9 +37,9 @@ class AliasedGroup(click.Group):
         if rv is not None:
             return rv
 
-        for key, aliases in SERVICE_MAP.items():
-            if cmd_name.lower() in map(str.lower, aliases):
-                return click.Group.get_command(self, ctx, key)
+        key = _ALIAS_INDEX.get(cmd_name.lower())
+        if key is not None:
+            return click.Group.get_command(self, ctx, key)
 
         return None
 
@@ -59,16 +66,12 @@ class SeasonRange(click.ParamType):
         """
         if len(tokens) == 0:
             return []
-        computed: list = []
-        exclusions: list = []
+        ranges: list[tuple[bool, int, int, int, int]] = []
         for token in tokens:
             exclude = token.startswith("-")
             if exclude:
                 token = token[1:]
-            parsed = [
-                re.match(r"^S(?P<season>\d+)(E(?P<episode>\d+))?$", x, re.IGNORECASE)
-                for x in re.split(r"[:-]", token)
-            ]
+            parsed = [_SE_RE.match(x) for x in _SPLIT_RE.split(token)]
             if len(parsed) > 2:
                 self.fail(f"Invalid token, only a left and right range is acceptable: {token}")
             if len(parsed) == 1:
@@ -87,21 +90,30 @@ class SeasonRange(click.ParamType):
                 self.fail(f"Invalid range, left side season cannot be bigger than right side season: {token}")
             if from_season == to_season and from_episode > to_episode:
                 self.fail(f"Invalid range, left side episode cannot be bigger than right side episode: {token}")
-            for s in range(from_season, to_season + 1):
-                for e in range(
-                    from_episode if s == from_season else 0,
-                    (self.MAX_EPISODE if s < to_season else to_episode) + 1
-                ):
-                    (computed if not exclude else exclusions).append(f"{s}x{e}")
-        for exclusion in exclusions:
-            if exclusion in computed:
-                computed.remove(exclusion)
-        return list(set(computed))
+            ranges.append((exclude, from_season, from_episode, to_season, to_episode))
+        # expand exclusions first so excluded episodes are never added, rather than removed afterwards
+        exclusions = {x for exclude, *range_ in ranges if exclude for x in self._expand(*range_)}
+        computed: dict[str, None] = {}  # insertion ordered set
+        for exclude, *range_ in ranges:
+            if not exclude:
+                for x in self._expand(*range_):
+                    if x not in exclusions:
+                        computed[x] = None
+        return list(computed)
+
+    def _expand(self, from_season: int, from_episode: int, to_season: int, to_episode: int) -> Iterator[str]:
+        """Yield each '{s}x{e}' string within a season/episode range."""
+        for s in range(from_season, to_season + 1):
+            # render the season prefix once, then just append each episode number to it
+            yield from map(f"{s}x".__add__, map(str, range(
+                from_episode if s == from_season else 0,
+                (self.MAX_EPISODE if s < to_season else to_episode) + 1
+            )))
 
     def convert(
         self, value: str, param: Optional[click.Parameter] = None, ctx: Optional[click.Context] = None
     ) -> list[str]:
-        return self.parse_tokens(*re.split(r"\s*[,;]\s*", value))
+        return self.parse_tokens(*_CSV_RE.split(value))
 
 
 class LanguageRange(click.ParamType):
@@ -114,7 +126,7 @@ class LanguageRange(click.ParamType):
             return value
         if not value:
             return []
-        return re.split(r"\s*[,;]\s*", value)
+        return _CSV_RE.split(value)
 
 
 class Quality(click.ParamType):
@@ -1,5 +1,5 @@
 import itertools
-from typing import Any, Iterable, Iterator, Sequence, Tuple, Type, Union
+from typing import Any, Iterable, Iterator, Tuple, Type, Union
 
 import requests
 
@@ -84,19 +84,28 @@ def flatten(items: Any, ignore_types: Union[Type, Tuple[Type, ...]] = str) -> It
     >>> list(flatten({1}, set))
     [{1}]
     """
-    if isinstance(items, (Iterable, Sequence)) and not isinstance(items, ignore_types):
-        for i in items:
-            yield from flatten(i, ignore_types)
-    else:
-        yield items
+    # walk an explicit stack of iterators rather than recursing a generator per nesting level
+    stack = [iter((items,))]
+    while stack:
+        for item in stack[-1]:
+            if not isinstance(item, ignore_types) and (
+                isinstance(item, (list, tuple)) or isinstance(item, Iterable)  # concrete check first, ABC is slow
+            ):
+                stack.append(iter(item))
+                break
+            yield item
+        else:
+            stack.pop()
 
 
 def merge_dict(source: dict, destination: dict) -> None:
     """Recursively merge Source into Destination in-place."""
-    for key, value in source.items():
-        if isinstance(value, dict):
-            # get node or create one
-            node = destination.setdefault(key, {})
-            merge_dict(value, node)
-        else:
-            destination[key] = value
+    stack = [(source, destination)]
+    while stack:
+        source, destination = stack.pop()
+        for key, value in source.items():
+            if isinstance(value, dict):
+                # get node or create one, and merge into it without recursing
+                stack.append((value, destination.setdefault(key, {})))
+            else:
+                destination[key] = value
@@ -17,6 +17,18 @@ from requests.structures import CaseInsensitiveDict
 from vinetrimmer import config
 from vinetrimmer.utils.collections import as_list
 
+try:
+    # faster JSON decoding, falls back to the standard library if not installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[no-redef]
+
+_IP_INFO_SESSION: Optional[requests.Session] = None
+
+_APPLE_TFHD_RE = re.compile(b"(tfhd\x00\x02\x00\x1a\x00\x00\x00\x01\x00\x00\x00)\x02")
+_APPLE_TFHD_CARRY = 15  # match length - 1
+_MERGE_CHUNK_SIZE = 1 << 20
+
 
 def load_toml(path: Union[Path, str]) -> dict:
     if not isinstance(path, Path):
@@ -28,7 +40,11 @@ def load_toml(path: Union[Path, str]) -> dict:
 
 def get_ip_info(session: Optional[requests.Session] = None) -> dict:
     """Use ipinfo.io to get IP location information."""
-    return (session or requests.Session()).get("https://ipinfo.io/json").json()
+    global _IP_INFO_SESSION
+    if not session:
+        # share one pooled session between calls, so repeat lookups reuse the connection
+        session = _IP_INFO_SESSION = _IP_INFO_SESSION or requests.Session()
+    return _json_loads(session.get("https://ipinfo.io/json").content)
 
 
 @contextlib.asynccontextmanager
@@ -68,22 +84,20 @@ def download_range(url: str, count: int, start: int = 0, proxy: Optional[str] =
         stderr=open(os.devnull, "wb"),
         shell=False
     )
-    buffer = b''
-    location = -1
-    while len(buffer) < count:
-        stdout = curl.stdout
-        data = b''
-        if stdout:
-            data = stdout.read(1)
-        if len(data) > 0:
-            location += len(data)
-            if location >= start:
-                buffer += data
-        else:
-            if curl.poll() is not None:
-                break
+    buffer = bytearray()
+    location = 0  # offset of the next byte curl will give us
+    stdout = curl.stdout
+    while stdout and len(buffer) < count:
+        # never ask for more than what's left to skip + what's left to keep, read() blocks until then or EOF
+        chunk = stdout.read(min(65536, max(0, start - location) + count - len(buffer)))
+        if not chunk:
+            break  # curl exited
+        location += len(chunk)
+        if location > start:
+            skip = max(0, start - (location - len(chunk)))
+            buffer += chunk[skip:skip + count - len(buffer)]
     curl.kill()  # stop downloading
-    return buffer
+    return bytes(buffer)
 
 
 async def aria2c(uri: Union[str, list[str]], out: Union[Path, str], headers: Optional[CaseInsensitiveDict] = None,
@@ -178,10 +192,21 @@ async def aria2c(uri: Union[str, list[str]], out: Union[Path, str], headers: Opt
         # merge the segments together
         with open(out, "wb") as f:
             for file in sorted(segments_dir.iterdir()):
-                data = file.read_bytes()
-                # Apple TV+ needs this done to fix audio decryption
-                data = re.sub(b"(tfhd\x00\x02\x00\x1a\x00\x00\x00\x01\x00\x00\x00)\x02", b"\\g<1>\x01", data)
-                f.write(data)
+                # stream each segment through a fixed size buffer instead of reading it whole
+                with file.open("rb") as src:
+                    carry = b""
+                    while True:
+                        chunk = src.read(_MERGE_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        data = carry + chunk
+                        if b"tfhd" in data:
+                            # Apple TV+ needs this done to fix audio decryption
+                            data = _APPLE_TFHD_RE.sub(b"\\g<1>\x01", data)
+                        # hold back enough bytes for a match that spans into the next chunk
+                        carry = data[-_APPLE_TFHD_CARRY:]
+                        f.write(data[:-_APPLE_TFHD_CARRY])
+                    f.write(carry)
                 file.unlink()  # delete, we don't need it anymore
         segments_dir.rmdir()
 
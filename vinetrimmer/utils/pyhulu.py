@@ -9,12 +9,15 @@ import requests
 
 from vinetrimmer.utils import Logger
 
+_EMPTY_MD5_UPPER = hashlib.md5(b"").hexdigest().upper()  # constant device identifier sent with playlist requests
+
 
 class Device(object):  # pylint: disable=too-few-public-methods
     """Data class used for containing device attributes."""
 
     def __init__(self, device_code: str, device_key: Union[bytes, str]):
         self.device_code = str(device_code)
+        self.device_code_bytes = self.device_code.encode("utf8")
 
         if isinstance(device_key, str):
             self.device_key = bytes.fromhex(device_key)
@@ -56,7 +59,7 @@ class HuluClient(pyhulu.HuluClient):
         @return: Dict of decrypted playlist response
         """
         params = {
-            "device_identifier": hashlib.md5().hexdigest().upper(),
+            "device_identifier": _EMPTY_MD5_UPPER,
             "deejay_device_id": int(self.device.device_code),
             "version": self.version,
             "content_eab_id": video_id,
@@ -80,12 +83,12 @@ class HuluClient(pyhulu.HuluClient):
         @return: Session key in bytes, and the config key ID.
         """
         random_value = random.randrange(100000, 1000000)
-        nonce = hashlib.md5(",".join([
-            binascii.hexlify(self.device.device_key).decode("utf8"),
-            self.device.device_code,
-            str(self.version),
-            str(random_value)
-        ]).encode("utf8")).hexdigest()
+        nonce = hashlib.md5(b"%b,%b,%b,%d" % (
+            binascii.hexlify(self.device.device_key),
+            self.device.device_code_bytes,
+            str(self.version).encode(),  # may be a str from the service config
+            random_value
+        )).hexdigest()
 
         payload = {
             "rv": random_value,
@@ -101,8 +104,11 @@ class HuluClient(pyhulu.HuluClient):
 
         config = self.decrypt_response(self.device.device_key, ciphertext)
 
-        derived_key_array = bytearray()
-        for device_byte, server_byte in zip(self.device.device_key, bytes.fromhex(config["key"])):
-            derived_key_array.append(device_byte ^ server_byte)
+        device_key = self.device.device_key
+        server_key = bytes.fromhex(config["key"])
+        size = min(len(device_key), len(server_key))
+        derived_key = (
+            int.from_bytes(device_key[:size], "big") ^ int.from_bytes(server_key[:size], "big")
+        ).to_bytes(size, "big")
 
-        return bytes(derived_key_array), config["key_id"]
+        return derived_key, config["key_id"]
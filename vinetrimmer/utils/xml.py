@@ -8,10 +8,13 @@ def load_xml(xml: Union[str, bytes]) -> ElementTree:
     if not isinstance(xml, bytes):
         xml = xml.encode("utf8")
     root = etree.fromstring(xml)
-    for elem in root.getiterator():
-        if not hasattr(elem.tag, "find"):
+    for elem in root.iter():
+        tag = elem.tag
+        if not isinstance(tag, str):
             # e.g. comment elements
             continue
-        elem.tag = etree.QName(elem).localname
+        if tag[0] == "{":
+            # strip the namespace ourselves rather than allocating a QName for its localname
+            elem.tag = tag[tag.index("}") + 1:]
     etree.cleanup_namespaces(root)
     return root
@@ -1,51 +1,129 @@
+from __future__ import annotations
+
+import importlib
 import logging
-from importlib.metadata import metadata
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Optional
 
 import click
 
-from vinetrimmer.commands import cfg, dl, wvd
-from vinetrimmer.config import directories, filenames
-from vinetrimmer.utils import Logger
-
-
-@click.group(context_settings=dict(
-    help_option_names=["-?", "-h", "--help"],
-    max_content_width=116,  # max PEP8 line-width, -4 to adjust for initial indent
-))
-@click.option("--debug", is_flag=True, default=False, help="Enable DEBUG level logs.")
-def main(debug: bool) -> None:
-    """
-    Vinetrimmer is the most convenient command-line program to
-    download videos from Widevine DRM-protected video platforms.
-
-    \b
-    TODO: - Supply -w to Services to allow them to only get Title data for the requested episodes
-            to reduce the amount of processing time and requests needed.
-    """
-    logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
-    log = Logger.getLogger(level=logging.DEBUG if debug else logging.INFO)
-
-    meta = metadata('vinetrimmer')
-
-    log.info(f"Vinetrimmer version {meta['version']} Copyright (c) 2019-2021 the Vinetrimmer Contributors")
-    log.info("Convenient Widevine-DRM Downloader and Decrypter.")
-    log.info(meta["home-page"])
-    log.info(f"[Root Config]     : {filenames.root_config}")
-    log.info(f"[Service Configs] : {directories.service_configs}")
-    log.info(f"[Cookies]         : {directories.cookies}")
-    log.info(f"[WVDs]            : {directories.wvds}")
-    log.info(f"[Cache]           : {directories.cache}")
-    log.info(f"[Logs]            : {directories.logs}")
-    log.info(f"[Temp Files]      : {directories.temp}")
-    log.info(f"[Downloads]       : {directories.downloads}")
-
-    # tldextract uses filelock, set to info level, annoying
-    logging.getLogger("filelock").setLevel(logging.WARNING)
-
-
-main.add_command(cfg)
-main.add_command(dl)
-main.add_command(wvd)
+from vinetrimmer._version import HOMEPAGE, __version__
+
+CONTEXT_SETTINGS = {
+    "help_option_names": ("-?", "-h", "--help"),
+    "max_content_width": 116  # max PEP8 line-width, -4 to adjust for initial indent
+}
+# passed explicitly rather than as main's docstring so it survives docstring stripping (python -OO)
+HELP = """
+Vinetrimmer is the most convenient command-line program to
+download videos from Widevine DRM-protected video platforms.
+
+\b
+TODO: - Supply -w to Services to allow them to only get Title data for the requested episodes
+        to reduce the amount of processing time and requests needed.
+"""
+BANNER = "\n".join([
+    "Vinetrimmer version %(version)s Copyright (c) 2019-2021 the Vinetrimmer Contributors",
+    "Convenient Widevine-DRM Downloader and Decrypter.",
+    "%(homepage)s",
+    "[Root Config]     : %(root_config)s",
+    "[Service Configs] : %(service_configs)s",
+    "[Cookies]         : %(cookies)s",
+    "[WVDs]            : %(wvds)s",
+    "[Cache]           : %(cache)s",
+    "[Logs]            : %(logs)s",
+    "[Temp Files]      : %(temp)s",
+    "[Downloads]       : %(downloads)s"
+])
+BANNER_DIRECTORIES = ("service_configs", "cookies", "wvds", "cache", "logs", "temp", "downloads")
+
+
+class LazyGroup(click.Group):
+    def __init__(self, *args: Any, lazy_subcommands: Optional[dict[str, str]] = None, **kwargs: Any):
+        """
+        Click Group that only imports a subcommand's module once that subcommand is looked up.
+
+        :param lazy_subcommands: map of command name to "module.path:attribute" of the command
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module, attribute = self.lazy_subcommands[cmd_name].split(":", 1)
+            self.add_command(getattr(importlib.import_module(module), attribute), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def parse_args(self, ctx: click.Context, args: list[str]) -> list[str]:
+        rest = super().parse_args(ctx, args)
+        # the subcommand's args are cleared from ctx before the group callback runs, note a help request now
+        # so the callback can tell that nothing will actually run, e.g. `dl --help`
+        ctx.meta["vinetrimmer.help"] = self.wants_subcommand_help(ctx)
+        return rest
+
+    def wants_subcommand_help(self, ctx: click.Context) -> bool:
+        """
+        Check if the subcommand's args ask for its help.
+
+        The args are parsed with the subcommand's own parser, so an option's value or anything after
+        `--` that happens to look like a help option isn't mistaken for one.
+        """
+        try:
+            cmd_name, cmd, cmd_args = self.resolve_command(ctx, [*ctx.protected_args, *ctx.args])
+        except click.UsageError:
+            return False
+        if not cmd:
+            return False
+        sub_ctx = click.Context(cmd, info_name=cmd_name, parent=ctx, resilient_parsing=True)
+        help_option = cmd.get_help_option(sub_ctx)
+        if not help_option:
+            return False
+        try:
+            opts, _, _ = cmd.make_parser(sub_ctx).parse_args(args=list(cmd_args))
+        except click.UsageError:
+            return False
+        return help_option.name in opts
+
+@lru_cache(maxsize=1)
+def _setup_logging(debug: bool) -> logging.Logger:
+    """Set up the root logger, only once and only when a command is actually going to run."""
+    from vinetrimmer.utils import Logger  # imports the Widevine stack, keep it off the help/completion path
+    return Logger.getLogger(level=logging.DEBUG if debug else logging.INFO)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    "cfg": "vinetrimmer.commands.cfg:cfg",
+    "dl": "vinetrimmer.commands.dl:dl",
+    "wvd": "vinetrimmer.commands.wvd:wvd"
+}, context_settings=CONTEXT_SETTINGS, help=HELP)
+@click.version_option(__version__, "-V", "--version", prog_name="vinetrimmer", message="%(prog)s %(version)s")
+@click.option("--debug", is_flag=True, default=False, envvar="VT_DEBUG", help="Enable DEBUG level logs.")
+@click.pass_context
+def main(ctx: click.Context, debug: bool) -> None:
+    """Entry point, sets up logging and prints the banner before the subcommand runs."""
+    will_run = (
+        ctx.invoked_subcommand is not None
+        and not ctx.resilient_parsing  # shell completion
+        and not ctx.meta.get("vinetrimmer.help")  # e.g. `dl --help`, nothing will run
+    )
+    if not will_run:
+        return
+
+    log = _setup_logging(debug)
+    if log.isEnabledFor(logging.INFO):
+        from vinetrimmer.config import directories, filenames
+        # formatting is left to logging, which only does it once a handler actually emits the record
+        # fetch every path shown in one attrgetter call
+        log.info(BANNER, {
+            **dict(zip(BANNER_DIRECTORIES, attrgetter(*BANNER_DIRECTORIES)(directories))),
+            "version": __version__,
+            "homepage": HOMEPAGE,
+            "root_config": filenames.root_config
+        })
 
 
 if __name__ == "__main__":